@@ -84,7 +84,7 @@ class CloudApiClient:
     #  \param on_finished: The function to be called after the upload is successful.
     #  \param on_progress: A function to be called during upload progress. It receives a percentage (0-100).
     #  \param on_error: A function to be called if the upload fails.
-    def uploadToolPath(self, print_job: CloudPrintJobResponse, mesh: bytes, on_finished: Callable[[], Any],
+    def uploadToolPath(self, print_job: CloudPrintJobResponse, mesh: memoryview, on_finished: Callable[[], Any],
                        on_progress: Callable[[int], Any], on_error: Callable[[], Any]):
         self._upload = ToolPathUploader(self._manager, print_job, mesh, on_finished, on_progress, on_error)
         self._upload.start()
@@ -113,6 +113,8 @@ class CloudApiClient:
     #   \param content_type: The type of the body contents.
     def _createEmptyRequest(self, path: str, content_type: Optional[str] = "application/json") -> QNetworkRequest:
         request = QNetworkRequest(QUrl(path))
+        # Allow the status polls and actions for all clusters to be multiplexed over a single connection.
+        request.setAttribute(QNetworkRequest.HTTP2AllowedAttribute, True)
         if content_type:
             request.setHeader(QNetworkRequest.ContentTypeHeader, content_type)
         access_token = self._account.accessToken
@@ -1,6 +1,6 @@
 # Copyright (c) 2019 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
-from time import time
+from time import monotonic, time
 from typing import List, Optional, cast
 
 from PyQt5.QtCore import QObject, QUrl, pyqtProperty, pyqtSignal, pyqtSlot
@@ -20,15 +20,11 @@ from .CloudApiClient import CloudApiClient
 from ..ExportFileJob import ExportFileJob
 from ..UltimakerNetworkedPrinterOutputDevice import UltimakerNetworkedPrinterOutputDevice
 from ..Messages.PrintJobUploadBlockedMessage import PrintJobUploadBlockedMessage
-from ..Messages.PrintJobUploadErrorMessage import PrintJobUploadErrorMessage
-from ..Messages.PrintJobUploadSuccessMessage import PrintJobUploadSuccessMessage
 from ..Models.Http.CloudClusterResponse import CloudClusterResponse
 from ..Models.Http.CloudClusterStatus import CloudClusterStatus
 from ..Models.Http.CloudPrintJobUploadRequest import CloudPrintJobUploadRequest
 from ..Models.Http.CloudPrintResponse import CloudPrintResponse
 from ..Models.Http.CloudPrintJobResponse import CloudPrintJobResponse
-from ..Models.Http.ClusterPrinterStatus import ClusterPrinterStatus
-from ..Models.Http.ClusterPrintJobStatus import ClusterPrintJobStatus
 
 
 I18N_CATALOG = i18nCatalog("cura")
@@ -89,13 +85,9 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         # Trigger the printersChanged signal when the private signal is triggered.
         self.printersChanged.connect(self._cloudClusterPrintersChanged)
 
-        # Keep server string of the last generated time to avoid updating models more than once for the same response
-        self._received_printers = None  # type: Optional[List[ClusterPrinterStatus]]
-        self._received_print_jobs = None  # type: Optional[List[ClusterPrintJobStatus]]
-
         # Reference to the uploaded print job / mesh
         # We do this to prevent re-uploading the same file multiple times.
-        self._tool_path = None  # type: Optional[bytes]
+        self._tool_path = None  # type: Optional[memoryview]
         self._uploaded_print_job = None  # type: Optional[CloudPrintJobResponse]
 
     ## Connects this device.
@@ -142,9 +134,9 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     ## Called when the network data should be updated.
     def _update(self) -> None:
         super()._update()
-        if time() - self._time_of_last_request < self.CHECK_CLUSTER_INTERVAL:
+        if monotonic() - self._time_of_last_request < self.CHECK_CLUSTER_INTERVAL:
             return  # avoid calling the cloud too often
-        self._time_of_last_request = time()
+        self._time_of_last_request = monotonic()
         if self._account.isLoggedIn:
             self.setAuthenticationState(AuthState.Authenticated)
             self._last_request_time = time()
@@ -156,12 +148,8 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     #  Contains both printers and print jobs statuses in a single response.
     def _onStatusCallFinished(self, status: CloudClusterStatus) -> None:
         self._responseReceived()
-        if status.printers != self._received_printers:
-            self._received_printers = status.printers
-            self._updatePrinters(status.printers)
-        if status.print_jobs != self._received_print_jobs:
-            self._received_print_jobs = status.print_jobs
-            self._updatePrintJobs(status.print_jobs)
+        self._updatePrinters(status.printers)
+        self._updatePrintJobs(status.print_jobs)
 
     ##  Called when Cura requests an output device to receive a (G-code) file.
     def requestWrite(self, nodes: List[SceneNode], file_name: Optional[str] = None, limit_mimetypes: bool = False,
@@ -218,7 +206,7 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     #  \param response: The response from the cloud API.
     def _onPrintUploadCompleted(self, response: CloudPrintResponse) -> None:
         self._progress.hide()
-        PrintJobUploadSuccessMessage().show()
+        self._showUploadSuccessMessage()
         self.writeFinished.emit()
 
     ## Displays the given message if uploading the mesh has failed
@@ -226,7 +214,7 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     def _onUploadError(self, message: str = None) -> None:
         self._progress.hide()
         self._uploaded_print_job = None
-        PrintJobUploadErrorMessage(message).show()
+        self._showUploadErrorMessage(message)
         self.writeError.emit()
 
     ##  Whether the printer that this output device represents supports print job actions via the cloud.
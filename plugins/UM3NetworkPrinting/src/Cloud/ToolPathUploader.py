@@ -19,17 +19,19 @@ class ToolPathUploader:
     # The HTTP codes that should trigger a retry.
     RETRY_HTTP_CODES = {500, 502, 503, 504}
 
-    # The amount of bytes to send per request
-    BYTES_PER_REQUEST = 256 * 1024
+    # The amount of bytes to send per request.
+    # The chunks of a resumable upload have to be sent in order, so we use large chunks to limit the amount of
+    # round trips. The size must be a multiple of 256 KiB.
+    BYTES_PER_REQUEST = 16 * 256 * 1024
 
     ## Creates a mesh upload object.
     #  \param manager: The network access manager that will handle the HTTP requests.
     #  \param print_job: The print job response that was returned by the cloud after registering the upload.
-    #  \param data: The mesh bytes to be uploaded.
+    #  \param data: The mesh bytes to be uploaded. Chunks are sliced from this view without copying the whole mesh.
     #  \param on_finished: The method to be called when done.
     #  \param on_progress: The method to be called when the progress changes (receives a percentage 0-100).
     #  \param on_error: The method to be called when an error occurs.
-    def __init__(self, manager: QNetworkAccessManager, print_job: CloudPrintJobResponse, data: bytes,
+    def __init__(self, manager: QNetworkAccessManager, print_job: CloudPrintJobResponse, data: memoryview,
                  on_finished: Callable[[], Any], on_progress: Callable[[int], Any], on_error: Callable[[], Any]
                  ) -> None:
         self._manager = manager
@@ -91,7 +93,7 @@ class ToolPathUploader:
         request = self._createRequest()
 
         # now send the reply and subscribe to the results
-        self._reply = self._manager.put(request, self._data[first_byte:last_byte])
+        self._reply = self._manager.put(request, bytes(self._data[first_byte:last_byte]))
         self._reply.finished.connect(self._finishedCallback)
         self._reply.uploadProgress.connect(self._progressCallback)
         self._reply.error.connect(self._errorCallback)
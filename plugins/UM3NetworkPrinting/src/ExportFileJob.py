@@ -15,6 +15,7 @@ class ExportFileJob(WriteFileJob):
     def __init__(self, file_handler: Optional[FileHandler], nodes: List[SceneNode], firmware_version: str) -> None:
 
         self._mesh_format_handler = MeshFormatHandler(file_handler, firmware_version)
+        self._output = None  # type: Optional[memoryview]
         if not self._mesh_format_handler.is_valid:
             Logger.log("e", "Missing file or mesh writer!")
             return
@@ -27,13 +28,19 @@ class ExportFileJob(WriteFileJob):
         extension = self._mesh_format_handler.preferred_format.get("extension", "")
         self.setFileName("{}.{}".format(job_name, extension))
 
+    ## Writes the scene to the stream on the job queue's worker thread.
+    #  The output buffer is collected here as well, so the UI thread only has to pick up the finished result.
+    def run(self) -> None:
+        super().run()
+        self._output = self._mesh_format_handler.getStreamBuffer(self.getStream())
+
     ## Get the mime type of the selected export file type.
     def getMimeType(self) -> str:
         return self._mesh_format_handler.mime_type
 
-    ## Get the job result as bytes as that is what we need to upload to the cluster.
-    def getOutput(self) -> bytes:
-        output = self.getStream().getvalue()
-        if isinstance(output, str):
-            output = output.encode("utf-8")
-        return output
+    ## Get the job result as a memoryview on the written bytes, which is what we upload to the cluster.
+    #  The result is a view on the stream's buffer, so the (potentially large) output is not copied.
+    def getOutput(self) -> memoryview:
+        if self._output is None:
+            self._output = self._mesh_format_handler.getStreamBuffer(self.getStream())
+        return self._output
@@ -1,7 +1,7 @@
 # Copyright (c) 2019 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
 import io
-from typing import Optional, Dict, Union, List, cast
+from typing import Optional, Dict, Union, List, Tuple, cast
 
 from UM.FileHandler.FileHandler import FileHandler
 from UM.FileHandler.FileWriter import FileWriter
@@ -12,6 +12,8 @@ from UM.Version import Version  # To check against firmware versions for support
 from UM.i18n import i18nCatalog
 from cura.CuraApplication import CuraApplication
 
+from .SignalInvalidatedCache import SignalInvalidatedCache
+
 
 I18N_CATALOG = i18nCatalog("cura")
 
@@ -19,6 +21,16 @@ I18N_CATALOG = i18nCatalog("cura")
 ## This class is responsible for choosing the formats used by the connected clusters.
 class MeshFormatHandler:
 
+    # The preferred formats chosen before, by global stack ID, firmware version and file handler.
+    # These only depend on the active machine, so they are cleared whenever the active machine changes.
+    _preferred_formats = SignalInvalidatedCache(lambda: [
+        CuraApplication.getInstance().globalContainerStackChanged
+    ])  # type: SignalInvalidatedCache[Tuple[str, str, int], Dict[str, Union[str, int, bool]]]
+
+    # Extra space reserved for text output on top of the sliced g-code.
+    # The g-code writer appends the serialised settings to the g-code, which are typically a few dozen kilobytes.
+    SETTINGS_SIZE_HEADROOM = 64 * 1024  # bytes
+
     def __init__(self, file_handler: Optional[FileHandler], firmware_version: str) -> None:
         self._file_handler = file_handler or CuraApplication.getInstance().getMeshFileHandler()
         self._preferred_format = self._getPreferredFormat(firmware_version)
@@ -56,38 +68,75 @@ class MeshFormatHandler:
         return cast(str, self._preferred_format["extension"])
 
     ## Creates the right kind of stream based on the preferred format.
-    def createStream(self) -> Union[io.BytesIO, io.StringIO]:
-        if self.file_mode == FileWriter.OutputMode.TextMode:
-            return io.StringIO()
-        else:
-            return io.BytesIO()
+    #  Text is encoded into a bytes buffer while it is written, so the result never has to be re-encoded or copied.
+    #  For text we reserve the buffer up front, binary output (e.g. UFP) is compressed so its size can't be estimated.
+    #  The text wrapper collects the many small g-code writes and passes them on to the buffer in larger blocks.
+    def createStream(self) -> Union[io.BytesIO, io.TextIOWrapper]:
+        buffer = io.BytesIO()
+        if self.file_mode != FileWriter.OutputMode.TextMode:
+            return buffer
+        estimated_size = self._estimateTextOutputSize()
+        if estimated_size > 0:
+            # Writing the last byte allocates the whole buffer at once, the writer then overwrites it from the start.
+            buffer.seek(estimated_size - 1)
+            buffer.write(b"\0")
+            buffer.seek(0)
+        return io.TextIOWrapper(buffer, encoding = "utf-8", newline = "")
+
+    ## Gets a view on the bytes written to a stream created by createStream, without copying them.
+    #  \param stream: The stream the writer wrote to. Text streams are detached from their buffer.
+    #  \return A memory view on the written bytes.
+    @staticmethod
+    def getStreamBuffer(stream: Union[io.BytesIO, io.TextIOWrapper]) -> memoryview:
+        if isinstance(stream, io.TextIOWrapper):
+            # Detach the buffer so the wrapper doesn't try to close it while the view is still exported.
+            stream = cast(io.BytesIO, stream.detach())
+            # Cut off the part of the reserved buffer that the writer did not use.
+            stream.truncate()
+        return stream.getbuffer()
 
     ## Writes the mesh and returns its value.
-    def getBytes(self, nodes: List[SceneNode]) -> bytes:
+    def getBytes(self, nodes: List[SceneNode]) -> memoryview:
         if self.writer is None:
             raise ValueError("There is no writer for the mesh format handler.")
         stream = self.createStream()
         self.writer.write(stream, nodes)
-        value = stream.getvalue()
-        if isinstance(value, str):
-            value = value.encode()
-        return value
+        return self.getStreamBuffer(stream)
+
+    ## Estimates the size of exported g-code based on the sliced g-code of the active build plate.
+    #  The g-code writer writes the sliced g-code as-is followed by the serialised settings, for which we add headroom.
+    #  \return The estimated size in bytes, or 0 if there is no g-code available.
+    @classmethod
+    def _estimateTextOutputSize(cls) -> int:
+        application = CuraApplication.getInstance()
+        gcode_dict = getattr(application.getController().getScene(), "gcode_dict", None)
+        if not gcode_dict:
+            return 0
+        active_build_plate = application.getMultiBuildPlateModel().activeBuildPlate
+        gcode_list = gcode_dict.get(active_build_plate)
+        if not gcode_list:
+            return 0
+        return sum(len(gcode) for gcode in gcode_list) + cls.SETTINGS_SIZE_HEADROOM
 
     ## Chooses the preferred file format for the given file handler.
     #  \param firmware_version: The version of the firmware.
     #  \return A dict with the file format details.
     def _getPreferredFormat(self, firmware_version: str) -> Dict[str, Union[str, int, bool]]:
-        # Formats supported by this application (file types that we can actually write).
         application = CuraApplication.getInstance()
 
-        file_formats = self._file_handler.getSupportedFileTypesWrite()
-
         global_stack = application.getGlobalContainerStack()
         # Create a list from the supported file formats string.
         if not global_stack:
             Logger.log("e", "Missing global stack!")
             return {}
 
+        cache_key = (global_stack.getId(), firmware_version, id(self._file_handler))
+        if cache_key in self._preferred_formats:
+            return self._preferred_formats[cache_key]
+
+        # Formats supported by this application (file types that we can actually write).
+        file_formats = self._file_handler.getSupportedFileTypesWrite()
+
         machine_file_formats = global_stack.getMetaDataEntry("file_formats").split(";")
         machine_file_formats = [file_type.strip() for file_type in machine_file_formats]
 
@@ -106,6 +155,8 @@ class MeshFormatHandler:
             raise OutputDeviceError.WriteRequestFailedError(
                 I18N_CATALOG.i18nc("@info:status", "There are no file formats available to write with!")
             )
+
+        self._preferred_formats[cache_key] = file_formats[0]
         return file_formats[0]
 
     ## Gets the file writer for the given file handler and mime type.
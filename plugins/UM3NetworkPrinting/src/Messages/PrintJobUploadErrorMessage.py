@@ -12,7 +12,16 @@ class PrintJobUploadErrorMessage(Message):
     
     def __init__(self, message: str = None) -> None:
         super().__init__(
-            text = message or I18N_CATALOG.i18nc("@info:text", "Could not upload the data to the printer."),
+            text = self._getText(message),
             title = I18N_CATALOG.i18nc("@info:title", "Network error"),
             lifetime = 10
         )
+
+    ## Changes the error that is shown, so the message can be shown again for a later error.
+    #  \param message: The error to show, or None to show the generic error text.
+    def setErrorText(self, message: str = None) -> None:
+        self.setText(self._getText(message))
+
+    @staticmethod
+    def _getText(message: str = None) -> str:
+        return message or I18N_CATALOG.i18nc("@info:text", "Could not upload the data to the printer.")
@@ -1,12 +1,22 @@
 # Copyright (c) 2019 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from UM.Settings.ContainerRegistry import ContainerRegistry
 from cura.PrinterOutput.Models.MaterialOutputModel import MaterialOutputModel
 
 from ..BaseModel import BaseModel
+from ...SignalInvalidatedCache import SignalInvalidatedCache
+
+
+# The metadata of the materials looked up before, by GUID, or None if there is no such material.
+# Printers report the same materials on every status update, so we only look them up in the registry once.
+_material_metadata_by_guid = SignalInvalidatedCache(lambda: [
+    ContainerRegistry.getInstance().containerAdded,
+    ContainerRegistry.getInstance().containerRemoved,
+    ContainerRegistry.getInstance().containerMetaDataChanged
+])  # type: SignalInvalidatedCache[Optional[str], Optional[Dict[str, Any]]]
 
 
 ## Class representing a cloud cluster printer configuration
@@ -32,15 +42,10 @@ class ClusterPrinterConfigurationMaterial(BaseModel):
     #   material with the earliest alphabetical name will be selected.
     #   \return A material output model that matches the current GUID.
     def createOutputModel(self) -> MaterialOutputModel:
-        container_registry = ContainerRegistry.getInstance()
-        same_guid = container_registry.findInstanceContainersMetadata(GUID = self.guid)
-        if same_guid:
-            read_only = sorted(filter(lambda metadata: container_registry.isReadOnly(metadata["id"]), same_guid), key = lambda metadata: metadata["name"])
-            if read_only:
-                material_metadata = read_only[0]
-            else:
-                material_metadata = min(same_guid, key = lambda metadata: metadata["name"])
-        else:
+        if self.guid not in _material_metadata_by_guid:
+            _material_metadata_by_guid[self.guid] = self._findMaterialMetadata()
+        material_metadata = _material_metadata_by_guid[self.guid]
+        if material_metadata is None:
             material_metadata = {
                 "color_code": self.color,
                 "brand": self.brand,
@@ -49,3 +54,14 @@ class ClusterPrinterConfigurationMaterial(BaseModel):
             }
 
         return MaterialOutputModel(guid = self.guid, type = material_metadata["material"], brand = material_metadata["brand"], color = material_metadata["color_code"], name = material_metadata["name"])
+
+    ##  Finds the metadata of the preferred material in the registry that matches the current GUID.
+    #   \return The material metadata, or None if there is no material with the current GUID.
+    def _findMaterialMetadata(self) -> Optional[Dict[str, Any]]:
+        container_registry = ContainerRegistry.getInstance()
+        same_guid = container_registry.findInstanceContainersMetadata(GUID = self.guid)
+        if not same_guid:
+            return None
+        read_only = (metadata for metadata in same_guid if container_registry.isReadOnly(metadata["id"]))
+        return min(read_only, key = lambda metadata: metadata["name"], default = None) \
+            or min(same_guid, key = lambda metadata: metadata["name"])
@@ -20,8 +20,6 @@ from .SendMaterialJob import SendMaterialJob
 from ..ExportFileJob import ExportFileJob
 from ..UltimakerNetworkedPrinterOutputDevice import UltimakerNetworkedPrinterOutputDevice
 from ..Messages.PrintJobUploadBlockedMessage import PrintJobUploadBlockedMessage
-from ..Messages.PrintJobUploadErrorMessage import PrintJobUploadErrorMessage
-from ..Messages.PrintJobUploadSuccessMessage import PrintJobUploadSuccessMessage
 from ..Models.Http.ClusterMaterial import ClusterMaterial
 
 
@@ -166,7 +164,7 @@ class LocalClusterOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         parts = [
             self._createFormPart("name=owner", bytes(self._getUserName(), "utf-8"), "text/plain"),
             self._createFormPart("name=\"file\"; filename=\"%s\"" % self._active_exported_job.getFileName(),
-                                 self._active_exported_job.getOutput())
+                                 bytes(self._active_exported_job.getOutput()))
         ]
         # If a specific printer was selected we include the name in the request.
         # FIXME: Connect should allow the printer UUID here instead of the 'unique_name'.
@@ -186,14 +184,14 @@ class LocalClusterOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     ## Handler for when the print job was fully uploaded to the cluster.
     def _onPrintUploadCompleted(self, _: QNetworkReply) -> None:
         self._progress.hide()
-        PrintJobUploadSuccessMessage().show()
+        self._showUploadSuccessMessage()
         self.writeFinished.emit()
 
     ## Displays the given message if uploading the mesh has failed
     #  \param message: The message to display.
     def _onUploadError(self, message: str = None) -> None:
         self._progress.hide()
-        PrintJobUploadErrorMessage(message).show()
+        self._showUploadErrorMessage(message)
         self.writeError.emit()
 
     ## Download all the images from the cluster and load their data in the print job models.
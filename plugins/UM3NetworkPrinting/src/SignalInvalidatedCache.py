@@ -0,0 +1,39 @@
+# Copyright (c) 2019 Ultimaker B.V.
+# Cura is released under the terms of the LGPLv3 or higher.
+from typing import Any, Callable, Dict, Generic, Hashable, List, TypeVar
+
+from UM.Signal import Signal
+
+
+K = TypeVar("K", bound = Hashable)
+V = TypeVar("V")
+
+
+## A dictionary of cached values that is cleared whenever one of the given signals is emitted.
+#  The signals are only connected when the first value is stored, so the cache can be created at import time,
+#  before the application that owns the signals exists.
+class SignalInvalidatedCache(Generic[K, V]):
+
+    ## Creates a new cache.
+    #  \param get_signals: A function returning the signals that invalidate the cached values.
+    def __init__(self, get_signals: Callable[[], List[Signal]]) -> None:
+        self._get_signals = get_signals
+        self._values = {}  # type: Dict[K, V]
+        self._connected = False
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._values
+
+    def __getitem__(self, key: K) -> V:
+        return self._values[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if not self._connected:
+            for signal in self._get_signals():
+                signal.connect(self.clear)
+            self._connected = True
+        self._values[key] = value
+
+    ## Clears the cached values, so they are determined again the next time they are needed.
+    def clear(self, *args: Any) -> None:
+        self._values.clear()
@@ -1,13 +1,14 @@
 # Copyright (c) 2019 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
 import os
-from time import time
+from time import monotonic
 from typing import List, Optional, Dict
 
 from PyQt5.QtCore import pyqtProperty, pyqtSignal, QObject, pyqtSlot, QUrl
 
 from UM.Logger import Logger
 from UM.Qt.Duration import Duration, DurationFormat
+from UM.Settings.Interfaces import ContainerInterface
 from cura.CuraApplication import CuraApplication
 from cura.PrinterOutput.Models.PrinterOutputModel import PrinterOutputModel
 from cura.PrinterOutput.NetworkedPrinterOutputDevice import NetworkedPrinterOutputDevice, AuthState
@@ -15,7 +16,9 @@ from cura.PrinterOutput.PrinterOutputDevice import ConnectionType, ConnectionSta
 
 from .Utils import formatTimeCompleted, formatDateCompleted
 from .ClusterOutputController import ClusterOutputController
+from .Messages.PrintJobUploadErrorMessage import PrintJobUploadErrorMessage
 from .Messages.PrintJobUploadProgressMessage import PrintJobUploadProgressMessage
+from .Messages.PrintJobUploadSuccessMessage import PrintJobUploadSuccessMessage
 from .Messages.NotClusterHostMessage import NotClusterHostMessage
 from .Models.UM3PrintJobOutputModel import UM3PrintJobOutputModel
 from .Models.Http.ClusterPrinterStatus import ClusterPrinterStatus
@@ -57,23 +60,39 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
         self.printersChanged.connect(self._clusterPrintersChanged)
 
         # Keeps track the last network response to determine if we are still connected.
-        self._time_of_last_response = time()
-        self._time_of_last_request = time()
+        # We use a monotonic clock so adjustments of the system time don't cause extra requests or disconnects.
+        self._time_of_last_response = monotonic()
+        self._time_of_last_request = monotonic()
 
         # Set the display name from the properties.
         self.setName(self.getProperty("name"))
 
         # Set the display name of the printer type.
-        definitions = CuraApplication.getInstance().getContainerRegistry().findContainers(id = self.printerType)
+        container_registry = CuraApplication.getInstance().getContainerRegistry()
+        definitions = container_registry.findContainers(id = self.printerType)
         self._printer_type_name = definitions[0].getName() if definitions else ""
 
+        # Re-apply the cluster data when materials change, as the models show the names of the matching materials.
+        container_registry.containerAdded.connect(self._onContainerChanged)
+        container_registry.containerMetaDataChanged.connect(self._onContainerChanged)
+        container_registry.containerRemoved.connect(self._onContainerChanged)
+
         # Keeps track of all printers in the cluster.
         self._printers = []  # type: List[PrinterOutputModel]
+        self._printers_by_key = {}  # type: Dict[str, PrinterOutputModel]
         self._has_received_printers = False
 
         # Keeps track of all print jobs in the cluster.
         self._print_jobs = []  # type: List[UM3PrintJobOutputModel]
 
+        # The print jobs that are queued or currently printing, refreshed whenever the print jobs are updated.
+        self._queued_print_jobs = []  # type: List[UM3PrintJobOutputModel]
+        self._active_print_jobs = []  # type: List[UM3PrintJobOutputModel]
+
+        # The printers and print jobs received in the last update, so we can skip updates that don't change anything.
+        self._received_printers = None  # type: Optional[List[ClusterPrinterStatus]]
+        self._received_print_jobs = None  # type: Optional[List[ClusterPrintJobStatus]]
+
         # Keep track of the printer currently selected in the UI.
         self._active_printer = None  # type: Optional[PrinterOutputModel]
 
@@ -86,6 +105,10 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
         # The job upload progress message modal.
         self._progress = PrintJobUploadProgressMessage()
 
+        # The messages shown when a job upload succeeded or failed. Created when first needed and re-used after that.
+        self._upload_success_message = None  # type: Optional[PrintJobUploadSuccessMessage]
+        self._upload_error_message = None  # type: Optional[PrintJobUploadErrorMessage]
+
     ##  The IP address of the printer.
     @pyqtProperty(str, constant=True)
     def address(self) -> str:
@@ -104,13 +127,12 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
     # Get all print jobs for this cluster that are queued.
     @pyqtProperty("QVariantList", notify=printJobsChanged)
     def queuedPrintJobs(self) -> List[UM3PrintJobOutputModel]:
-        return [print_job for print_job in self._print_jobs if print_job.state in self.QUEUED_PRINT_JOBS_STATES]
+        return self._queued_print_jobs
 
     # Get all print jobs for this cluster that are currently printing.
     @pyqtProperty("QVariantList", notify=printJobsChanged)
     def activePrintJobs(self) -> List[UM3PrintJobOutputModel]:
-        return [print_job for print_job in self._print_jobs if
-                print_job.assignedPrinter is not None and print_job.state not in self.QUEUED_PRINT_JOBS_STATES]
+        return self._active_print_jobs
 
     @pyqtProperty(bool, notify=_clusterPrintersChanged)
     def receivedData(self) -> bool:
@@ -216,7 +238,7 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
     #  Re-connecting is handled automatically by the output device managers in this plugin.
     #  TODO: it would be nice to have this logic in the managers, but connecting those with signals causes crashes.
     def _checkStillConnected(self) -> None:
-        time_since_last_response = time() - self._time_of_last_response
+        time_since_last_response = monotonic() - self._time_of_last_response
         if time_since_last_response > self.NETWORK_RESPONSE_CONSIDER_OFFLINE:
             self.setConnectionState(ConnectionState.Closed)
             if self.key in CuraApplication.getInstance().getOutputDeviceManager().getOutputDeviceIds():
@@ -248,40 +270,84 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
         if self.key == stored_cluster_id:
             CuraApplication.getInstance().getOutputDeviceManager().addOutputDevice(self)
 
+    ## Shows the message that a print job was uploaded successfully.
+    def _showUploadSuccessMessage(self) -> None:
+        if not self._upload_success_message:
+            self._upload_success_message = PrintJobUploadSuccessMessage()
+        self._upload_success_message.show()
+
+    ## Shows the message that uploading a print job failed.
+    #  \param message: The error to show, or None to show the generic error text.
+    def _showUploadErrorMessage(self, message: str = None) -> None:
+        if not self._upload_error_message:
+            self._upload_error_message = PrintJobUploadErrorMessage(message)
+        else:
+            # Hide the message first if it's still visible, as showing it again won't update the text on screen.
+            if self._upload_error_message.visible:
+                self._upload_error_message.hide()
+            self._upload_error_message.setErrorText(message)
+        self._upload_error_message.show()
+
     def _responseReceived(self) -> None:
-        self._time_of_last_response = time()
+        self._time_of_last_response = monotonic()
 
     def _updatePrinters(self, remote_printers: List[ClusterPrinterStatus]) -> None:
         self._responseReceived()
 
+        # Nothing to update if the printers are exactly the same as in the last update.
+        # The cluster host check still runs, as its outcome also depends on our connection state.
+        if remote_printers == self._received_printers:
+            self._checkIfClusterHost()
+            return
+        previous_printers = {printer_data.uuid: printer_data for printer_data in self._received_printers or []}
+        self._received_printers = remote_printers
+
         # Keep track of the new printers to show.
         # We create a new list instead of changing the existing one to get the correct order.
         new_printers = []  # type: List[PrinterOutputModel]
+        new_printers_by_key = {}  # type: Dict[str, PrinterOutputModel]
 
         # Check which printers need to be created or updated.
         for index, printer_data in enumerate(remote_printers):
-            printer = next(iter(printer for printer in self._printers if printer.key == printer_data.uuid), None)
+            printer = self._printers_by_key.get(printer_data.uuid)
             if printer is None:
                 printer = printer_data.createOutputModel(ClusterOutputController(self))
-            else:
+            elif printer_data != previous_printers.get(printer_data.uuid):
                 printer_data.updateOutputModel(printer)
             new_printers.append(printer)
+            new_printers_by_key[printer_data.uuid] = printer
 
         # Check which printers need to be removed (de-referenced).
-        remote_printers_keys = [printer_data.uuid for printer_data in remote_printers]
-        removed_printers = [printer for printer in self._printers if printer.key not in remote_printers_keys]
+        removed_printers = [printer for printer in self._printers if printer.key not in new_printers_by_key]
         for removed_printer in removed_printers:
             if self._active_printer and self._active_printer.key == removed_printer.key:
                 self.setActivePrinter(None)
 
+        # Print jobs are assigned to printers by key, so they need to be applied again when printers came or went.
+        if new_printers_by_key.keys() != self._printers_by_key.keys():
+            self._received_print_jobs = None
+
+        # Changes to existing printers are signalled by the printer models themselves.
+        # We only have to notify about the list of printers when printers were added, removed or re-ordered.
+        printers_changed = not self._has_received_printers or list(new_printers_by_key) != list(self._printers_by_key)
+
         self._printers = new_printers
+        self._printers_by_key = new_printers_by_key
         self._has_received_printers = True
         if self._printers and not self.activePrinter:
             self.setActivePrinter(self._printers[0])
 
-        self.printersChanged.emit()
+        if printers_changed:
+            self.printersChanged.emit()
         self._checkIfClusterHost()
 
+    ## Forgets the received printers and print jobs when a material changes, so the next update applies them again.
+    #  The material names shown in the printer and print job models are then looked up again as well.
+    def _onContainerChanged(self, container: ContainerInterface) -> None:
+        if container.getMetaDataEntry("type") == "material":
+            self._received_printers = None
+            self._received_print_jobs = None
+
     ## Check is this device is a cluster host and takes the needed actions when it is not.
     def _checkIfClusterHost(self):
         if len(self._printers) < 1 and self.isConnected():
@@ -294,18 +360,29 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
     def _updatePrintJobs(self, remote_jobs: List[ClusterPrintJobStatus]) -> None:
         self._responseReceived()
 
+        # Nothing to update if the print jobs are exactly the same as in the last update.
+        if remote_jobs == self._received_print_jobs:
+            return
+        previous_print_jobs = {print_job_data.uuid: print_job_data for print_job_data in self._received_print_jobs or []}
+        self._received_print_jobs = remote_jobs
+
+        # Changes to existing print jobs are signalled by the print job models themselves.
+        # We only have to notify when one of the print job lists changed, e.g. because a job was assigned to a printer.
+        previous_print_job_lists = (self._print_jobs, self._queued_print_jobs, self._active_print_jobs)
+
         # Keep track of the new print jobs to show.
         # We create a new list instead of changing the existing one to get the correct order.
         new_print_jobs = []
+        current_print_jobs = {print_job.key: print_job for print_job in self._print_jobs}
 
         # Check which print jobs need to be created or updated.
         for index, print_job_data in enumerate(remote_jobs):
-            print_job = next(
-                iter(print_job for print_job in self._print_jobs if print_job.key == print_job_data.uuid), None)
+            print_job = current_print_jobs.get(print_job_data.uuid)
             if not print_job:
                 new_print_jobs.append(self._createPrintJobModel(print_job_data))
             else:
-                print_job_data.updateOutputModel(print_job)
+                if print_job_data != previous_print_jobs.get(print_job_data.uuid):
+                    print_job_data.updateOutputModel(print_job)
                 if print_job_data.printer_uuid:
                     self._updateAssignedPrinter(print_job, print_job_data.printer_uuid)
                 if print_job_data.assigned_to:
@@ -313,14 +390,26 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
                 new_print_jobs.append(print_job)
 
         # Check which print job need to be removed (de-referenced).
-        remote_job_keys = [print_job_data.uuid for print_job_data in remote_jobs]
-        removed_jobs = [print_job for print_job in self._print_jobs if print_job.key not in remote_job_keys]
+        remote_job_keys = {print_job_data.uuid for print_job_data in remote_jobs}
+        removed_jobs = [print_job for key, print_job in current_print_jobs.items() if key not in remote_job_keys]
         for removed_job in removed_jobs:
             if removed_job.assignedPrinter:
                 removed_job.assignedPrinter.updateActivePrintJob(None)
 
         self._print_jobs = new_print_jobs
-        self.printJobsChanged.emit()
+        self._updateQueuedAndActivePrintJobs()
+        if previous_print_job_lists != (self._print_jobs, self._queued_print_jobs, self._active_print_jobs):
+            self.printJobsChanged.emit()
+
+    ## Splits the print jobs into the queued and active lists, so the QML bindings don't filter them on every read.
+    #  This is called after every applied print job update. The caller compares the lists to decide whether to notify
+    #  QML, as they can change without the job data changing, e.g. when a printer gets assigned later.
+    def _updateQueuedAndActivePrintJobs(self) -> None:
+        self._queued_print_jobs = [print_job for print_job in self._print_jobs
+                                   if print_job.state in self.QUEUED_PRINT_JOBS_STATES]
+        self._active_print_jobs = [print_job for print_job in self._print_jobs if
+                                   print_job.assignedPrinter is not None and
+                                   print_job.state not in self.QUEUED_PRINT_JOBS_STATES]
 
     ## Create a new print job model based on the remote status of the job.
     #  \param remote_job: The remote print job data.
@@ -334,7 +423,7 @@ class UltimakerNetworkedPrinterOutputDevice(NetworkedPrinterOutputDevice):
 
     ## Updates the printer assignment for the given print job model.
     def _updateAssignedPrinter(self, model: UM3PrintJobOutputModel, printer_uuid: str) -> None:
-        printer = next((p for p in self._printers if printer_uuid == p.key), None)
+        printer = self._printers_by_key.get(printer_uuid)
         if not printer:
             return
         printer.updateActivePrintJob(model)